@@ -18,6 +18,13 @@ class PageWiseLineItems(BaseModel):
     sub_total: Optional[float] = Field(None, description="Subtotal for this page if exists")
 
 
+class LLMExtractionResult(BaseModel):
+    """Raw pagewise payload returned by the LLM, before reconciliation."""
+    pagewise_line_items: List[PageWiseLineItems] = Field(..., description="Line items grouped by page")
+    actual_bill_total: Optional[float] = Field(None, description="Total amount as printed on the bill")
+    extraction_notes: Optional[str] = Field(None, description="Notes about ambiguities or special cases")
+
+
 class ExtractedData(BaseModel):
     """Extracted bill data."""
     pagewise_line_items: List[PageWiseLineItems] = Field(..., description="Line items grouped by page")
@@ -38,3 +45,28 @@ class BillExtractionResponse(BaseModel):
     data: Optional[ExtractedData] = Field(None, description="Extracted data")
     error: Optional[str] = Field(None, description="Error message if any")
 
+
+class MultiDocumentRequest(BaseModel):
+    """Request model for extracting several documents in one call."""
+    documents: List[str] = Field(..., description="URLs of the documents")
+
+
+class MultiDocumentResponse(BaseModel):
+    """Response model for multi-document extraction."""
+    results: List[BillExtractionResponse] = Field(..., description="Per-document results, in request order")
+
+
+class BatchSubmitResponse(BaseModel):
+    """Response model for batch extraction submission."""
+    is_success: bool = Field(..., description="Whether submission was successful")
+    batch_id: Optional[str] = Field(None, description="OpenAI batch job ID")
+    error: Optional[str] = Field(None, description="Error message if any")
+
+
+class BatchStatusResponse(BaseModel):
+    """Response model for batch extraction status polling."""
+    is_success: bool = Field(..., description="Whether the status check was successful")
+    status: Optional[str] = Field(None, description="Batch job status")
+    data: Optional[ExtractedData] = Field(None, description="Extracted data if completed")
+    error: Optional[str] = Field(None, description="Error message if any")
+
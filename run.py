@@ -1,13 +1,22 @@
 """Script to run the FastAPI application."""
+import os
+
 import uvicorn
+
 from app.config import config
 
+# DEV=1 enables live reload (single worker); otherwise run one worker
+# per core on the uvloop event loop with the httptools HTTP parser
+DEV = os.getenv("DEV", "0") == "1"
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host=config.API_HOST,
         port=config.API_PORT,
-        reload=True,
+        reload=DEV,
+        workers=1 if DEV else int(os.getenv("WORKERS", os.cpu_count() or 2)),
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
-